@@ -2,6 +2,10 @@ import pygame
 from typing import Tuple, Optional
 
 class Camera:
+    # Slot the attributes so hot-path access is a fixed-offset read instead
+    # of an instance __dict__ lookup
+    __slots__ = ('screen_size', 'x', 'y', 'zoom', 'min_zoom', 'max_zoom', 'pan_speed')
+
     def __init__(self, screen_size: Tuple[int, int]):
         self.screen_size = screen_size
         self.x = 0  # Camera position in world coordinates
@@ -13,23 +17,22 @@ class Camera:
         
     def move(self, dx: float, dy: float, dt: float):
         """Move camera by delta, scaled by time and zoom"""
-        self.x += dx * dt * self.pan_speed / self.zoom
-        self.y += dy * dt * self.pan_speed / self.zoom
-        
+        # Compute the shared scale factor once for both axes
+        k = dt * self.pan_speed / self.zoom
+        self.x += dx * k
+        self.y += dy * k
+
     def adjust_zoom(self, factor: float, mouse_pos: Optional[Tuple[int, int]] = None):
         """Zoom in/out, optionally centered on mouse position"""
         old_zoom = self.zoom
         self.zoom = max(self.min_zoom, min(self.max_zoom, self.zoom * factor))
-        
-        # If mouse position is provided, zoom towards that point
+
+        # If mouse position is provided, zoom towards that point: shifting
+        # the camera by mouse*(1/old - 1/new) keeps that point fixed
         if mouse_pos:
-            mouse_x, mouse_y = mouse_pos
-            # Convert mouse position to world coordinates before zoom
-            world_x = mouse_x / old_zoom + self.x
-            world_y = mouse_y / old_zoom + self.y
-            # Adjust camera position to keep mouse point fixed
-            self.x = world_x - mouse_x / self.zoom
-            self.y = world_y - mouse_y / self.zoom
+            shift = 1.0 / old_zoom - 1.0 / self.zoom
+            self.x += mouse_pos[0] * shift
+            self.y += mouse_pos[1] * shift
             
     def world_to_screen(self, world_x: float, world_y: float) -> Tuple[float, float]:
         """Convert world coordinates to screen coordinates"""
@@ -1,16 +1,51 @@
 import pygame
 import sys
+import numpy as np
 from typing import Tuple, List, Optional, Dict
-from world.world import World, TerrainType
+from world.world import World, TerrainType, PALETTE
 from game.mechanics import GameState, ImprovementType, ResourceType
 from .camera import Camera
 
+
+def _bbox6(vertices: List[Tuple[float, float]]) -> Tuple[float, float, float, float]:
+    """Bounding box of a six-vertex ring via unrolled comparisons"""
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3), (x4, y4), (x5, y5) = vertices
+    min_x = max_x = x0
+    min_y = max_y = y0
+    if x1 < min_x: min_x = x1
+    elif x1 > max_x: max_x = x1
+    if x2 < min_x: min_x = x2
+    elif x2 > max_x: max_x = x2
+    if x3 < min_x: min_x = x3
+    elif x3 > max_x: max_x = x3
+    if x4 < min_x: min_x = x4
+    elif x4 > max_x: max_x = x4
+    if x5 < min_x: min_x = x5
+    elif x5 > max_x: max_x = x5
+    if y1 < min_y: min_y = y1
+    elif y1 > max_y: max_y = y1
+    if y2 < min_y: min_y = y2
+    elif y2 > max_y: max_y = y2
+    if y3 < min_y: min_y = y3
+    elif y3 > max_y: max_y = y3
+    if y4 < min_y: min_y = y4
+    elif y4 > max_y: max_y = y4
+    if y5 < min_y: min_y = y5
+    elif y5 > max_y: max_y = y5
+    return min_x, max_x, min_y, max_y
+
 class GameEngine:
-    def __init__(self, screen_size: Tuple[int, int] = (800, 600)):
+    def __init__(self, screen_size: Tuple[int, int] = (800, 600), headless: bool = False):
         pygame.init()
         self.screen_size = screen_size
-        self.screen = pygame.display.set_mode(screen_size)
-        pygame.display.set_caption("Younger Dryas")
+        # Headless mode keeps the window hidden and skips rendering so
+        # agents can drive the game state without paying for drawing
+        self.headless = headless
+        if headless:
+            self.screen = pygame.display.set_mode(screen_size, pygame.HIDDEN)
+        else:
+            self.screen = pygame.display.set_mode(screen_size)
+            pygame.display.set_caption("Younger Dryas")
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
@@ -24,12 +59,37 @@ class GameEngine:
         # Initialize game state
         self.game_state = GameState()
         
+        # Terrain colors pre-blended with each player's color for the
+        # ownership tint applied in render
+        self._blended_colors = {
+            (player.id, terrain): tuple(
+                int(p * 0.7 + t * 0.3)
+                for p, t in zip(player.color, PALETTE[terrain])
+            )
+            for player in self.game_state.players
+            for terrain in TerrainType
+        }
+        
         # Input state
         self.dragging = False
         self.last_mouse_pos = None
         self.selected_hex: Optional[Tuple[int, int]] = None
         self.hovered_hex: Optional[Tuple[int, int]] = None
         self.drag_start_pos = None
+        # Last hover lookup, keyed by mouse position and camera pose; the
+        # mouse usually sits still between frames
+        self._hover_cache_key = None
+        self._hover_cache_val = None
+        
+        # Fonts, created once instead of per draw call; 74 is the victory
+        # screen headline
+        self._fonts = {
+            size: pygame.font.Font(None, size)
+            for size in (20, 24, 36, 48, 74)
+        }
+        # Rendered text surfaces keyed by (text, size, color); text that
+        # repeats across frames is rasterized only once
+        self._text_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
         
         # UI state
         self.show_build_menu = False
@@ -38,11 +98,22 @@ class GameEngine:
         self.selected_improvement = None
         self.action_buttons = self._create_action_buttons()
         self.escape_menu_buttons = self._create_escape_menu_buttons()
-        
-        # Victory screen
-        self.victory_font = pygame.font.Font(None, 74)  # Large font for victory message
-        self.button_font = pygame.font.Font(None, 36)  # Smaller font for buttons
-        
+        # Flat rect list so hover and click lookups resolve in one
+        # C-level collidelist call
+        self._action_button_rects = [b['rect'] for b in self.action_buttons]
+        # Button backgrounds keyed by (size, hover, disabled); the fill and
+        # border are rasterized once per state and blitted afterwards
+        self._button_bg_cache: Dict[Tuple[Tuple[int, int], bool, bool], pygame.Surface] = {}
+        # Improvement icon sprites keyed by (improvement, zoom bucket)
+        self._icon_cache: Dict[Tuple[ImprovementType, int], pygame.Surface] = {}
+        # Hex tile sprites keyed by (terrain, owner, improvement); the cache
+        # is rebuilt lazily whenever the zoom level changes
+        self._tile_cache: Dict[Tuple, pygame.Surface] = {}
+        self._tile_cache_zoom: Optional[float] = None
+        # Composed UI panel surfaces plus the state key they were built
+        # from; panels are rebuilt only when their state changes
+        self._panel_cache: Dict[str, Tuple[object, pygame.Surface]] = {}
+
     def _create_escape_menu_buttons(self) -> List[Dict]:
         """Create the escape menu buttons"""
         button_width = 200
@@ -82,13 +153,16 @@ class GameEngine:
             'hover': False
         })
         
-        # Add improvement buttons
+        # Add improvement buttons, each carrying its pre-rendered cost label
         for i, improvement in enumerate(self.build_options, 1):  # Start at 1 to account for claim button
+            costs = GameState.IMPROVEMENT_COSTS[improvement]
+            cost_text = ", ".join(f"{amount} {res.label}" for res, amount in costs.items())
             buttons.append({
                 'rect': pygame.Rect(start_x + i * (button_width + spacing), bottom_y, button_width, button_height),
                 'text': improvement.value,
                 'action': improvement,
-                'hover': False
+                'hover': False,
+                'cost_surface': self._text(cost_text, 24, (200, 200, 200))
             })
         
         # Add end turn button
@@ -107,6 +181,31 @@ class GameEngine:
         
         return buttons
         
+    def _button_bg(self, size: Tuple[int, int], hover: bool, disabled: bool = False) -> pygame.Surface:
+        """Get the cached background surface for a button state"""
+        key = (size, hover, disabled)
+        surface = self._button_bg_cache.get(key)
+        if surface is None:
+            if disabled:
+                fill_color = (40, 40, 40)  # Darker when unavailable
+            else:
+                fill_color = (70, 70, 70) if hover else (50, 50, 50)
+            border_color = (200, 200, 200) if hover else (100, 100, 100)
+            surface = pygame.Surface(size)
+            surface.fill(fill_color)
+            pygame.draw.rect(surface, border_color, surface.get_rect(), 2)
+            self._button_bg_cache[key] = surface
+        return surface
+
+    def _text(self, text: str, size: int, color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
+        """Render text through the cache, rasterizing only on first use"""
+        key = (text, size, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._fonts[size].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+
     def get_hex_at_screen_pos(self, screen_pos: Tuple[float, float]) -> Optional[Tuple[int, int]]:
         """Convert screen coordinates to hex grid coordinates"""
         # Check if mouse is outside the window
@@ -138,8 +237,9 @@ class GameEngine:
         mouse_pos = pygame.mouse.get_pos()
         
         # Update button hover states
-        for button in self.action_buttons:
-            button['hover'] = button['rect'].collidepoint(mouse_pos)
+        hover_idx = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._action_button_rects)
+        for i, button in enumerate(self.action_buttons):
+            button['hover'] = i == hover_idx
         if self.show_escape_menu:
             for button in self.escape_menu_buttons:
                 button['hover'] = button['rect'].collidepoint(mouse_pos)
@@ -147,9 +247,16 @@ class GameEngine:
         # Store previous states
         prev_hovered = self.hovered_hex
         
-        # Update hover state
-        current_hex = self.get_hex_at_screen_pos(mouse_pos)
-        
+        # Update hover state, reusing the last lookup when neither the mouse
+        # nor the camera has moved since the previous frame
+        hover_key = (mouse_pos, self.camera.x, self.camera.y, self.camera.zoom)
+        if hover_key == self._hover_cache_key:
+            current_hex = self._hover_cache_val
+        else:
+            current_hex = self.get_hex_at_screen_pos(mouse_pos)
+            self._hover_cache_key = hover_key
+            self._hover_cache_val = current_hex
+
         if current_hex is None and not self.dragging:
             self.hovered_hex = None
         else:
@@ -177,25 +284,24 @@ class GameEngine:
                                 break
                     else:
                         # Check if clicked on an action button
-                        for button in self.action_buttons:
-                            if button['rect'].collidepoint(event.pos):
-                                if button['action'] == 'end_turn':
-                                    self.game_state.end_turn()
-                                elif button['action'] == 'claim' and self.hovered_hex:
-                                    col, row = self.hovered_hex
-                                    if self.game_state.claim_hex(col, row):
-                                        self.selected_hex = self.hovered_hex
-                                elif self.selected_hex:
-                                    col, row = self.selected_hex
-                                    self.game_state.build_improvement(col, row, button['action'])
-                                break
-                        else:  # If no button was clicked
-                            if self.show_build_menu:
-                                self.handle_build_menu_click(event.pos)
-                            else:
-                                self.dragging = True
-                                self.last_mouse_pos = event.pos
-                                self.drag_start_pos = event.pos
+                        idx = pygame.Rect(event.pos, (1, 1)).collidelist(self._action_button_rects)
+                        if idx != -1:
+                            button = self.action_buttons[idx]
+                            if button['action'] == 'end_turn':
+                                self.game_state.end_turn()
+                            elif button['action'] == 'claim' and self.hovered_hex:
+                                col, row = self.hovered_hex
+                                if self.game_state.claim_hex(col, row):
+                                    self.selected_hex = self.hovered_hex
+                            elif self.selected_hex:
+                                col, row = self.selected_hex
+                                self.game_state.build_improvement(col, row, button['action'])
+                        elif self.show_build_menu:
+                            self.handle_build_menu_click(event.pos)
+                        else:
+                            self.dragging = True
+                            self.last_mouse_pos = event.pos
+                            self.drag_start_pos = event.pos
                 elif event.button == 3 and not self.show_escape_menu:  # Right click
                     if self.selected_hex:
                         self.show_build_menu = True
@@ -225,7 +331,7 @@ class GameEngine:
             return
             
         col, row = self.hovered_hex
-        hex_data = self.game_state.get_hex_data(col, row)
+        hex_data = self.game_state.peek_hex_data(col, row)
         
         # If hex is unclaimed and we can claim it, do so
         if hex_data.owner is None and self.game_state.can_claim_hex(col, row):
@@ -264,109 +370,121 @@ class GameEngine:
             self.camera.move(dx, dy, 1/self.fps)
         
     def render(self):
+        if self.headless:
+            return
+
         self.screen.fill((0, 0, 0))  # Clear screen
-        
-        # Calculate visible area
-        padding_x = self.world.hex_size * 2 / self.camera.zoom
-        padding_y = self.world.hex_size * 2 / self.camera.zoom
-        left, top = self.camera.screen_to_world(-padding_x, -padding_y)
-        right, bottom = self.camera.screen_to_world(
-            self.screen_size[0] + padding_x, 
-            self.screen_size[1] + padding_y
-        )
-        
-        # Convert world bounds to hex coordinates
-        start_col, start_row = self.world.pixel_to_hex(left, top)
-        end_col, end_row = self.world.pixel_to_hex(right, bottom)
-        
-        # Add padding to ensure we render tiles just outside view
-        start_col -= 2
-        start_row -= 2
-        end_col += 2
-        end_row += 2
-        
-        # First pass: Draw hex fills
-        visible_hexes = []
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                # Get hex center in world coordinates
-                center_x, center_y = self.world.hex_to_pixel(col, row)
-                
-                # Convert to screen coordinates
-                screen_x, screen_y = self.camera.world_to_screen(center_x, center_y)
-                
-                # Calculate vertices
-                vertices = []
-                for vx, vy in self.world.hex_vert:
-                    screen_vx = screen_x + vx * self.camera.zoom
-                    screen_vy = screen_y + vy * self.camera.zoom
-                    vertices.append((screen_vx, screen_vy))
-                
-                # Check if hex is potentially visible
-                min_x = min(v[0] for v in vertices)
-                max_x = max(v[0] for v in vertices)
-                min_y = min(v[1] for v in vertices)
-                max_y = max(v[1] for v in vertices)
-                
-                if (max_x >= -self.world.hex_size and 
-                    min_x <= self.screen_size[0] + self.world.hex_size and
-                    max_y >= -self.world.hex_size and 
-                    min_y <= self.screen_size[1] + self.world.hex_size):
-                    # Get terrain color
-                    wrapped_col = col % self.world.width
-                    wrapped_row = row % self.world.height
-                    color = self.world.get_color_at(wrapped_col, wrapped_row)
-                    
-                    # Modify color based on ownership
-                    hex_data = self.game_state.get_hex_data(col, row)
-                    if hex_data.owner is not None:
-                        player_color = self.game_state.players[hex_data.owner].color
-                        # Blend with terrain color
-                        color = tuple(
-                            int((c1 * 0.7 + c2 * 0.3))
-                            for c1, c2 in zip(player_color, color)
-                        )
-                    
-                    # Draw base hex fill
-                    pygame.draw.polygon(self.screen, color, vertices)
-                    
-                    # Draw improvement icon if any
-                    if hex_data.improvement:
-                        self.draw_improvement_icon(screen_x, screen_y, hex_data.improvement)
-                    
-                    # Store for border rendering
-                    hex_coord = (col, row)
-                    visible_hexes.append((vertices, hex_coord))
-        
-        # Second pass: Draw borders
-        for vertices, hex_coord in visible_hexes:
-            # Draw borders as individual lines for consistent thickness
-            for i in range(len(vertices)):
-                start = vertices[i]
-                end = vertices[(i + 1) % len(vertices)]
-                
-                # Determine border color and width based on hex state
-                if hex_coord == self.selected_hex:
-                    # Draw a thicker white border for selected hex
-                    width = max(3, int(self.camera.zoom * 2.5))
-                    # Draw outer glow
-                    pygame.draw.line(self.screen, (200, 200, 200), start, end, width + 2)
-                    # Draw main border
-                    pygame.draw.line(self.screen, (255, 255, 255), start, end, width)
-                elif hex_coord == self.hovered_hex and not self.dragging:
-                    # Draw a more visible hover effect
-                    width = max(2, int(self.camera.zoom * 2))
-                    # Draw outer glow
-                    pygame.draw.line(self.screen, (140, 140, 140), start, end, width + 2)
-                    # Draw main border
-                    pygame.draw.line(self.screen, (180, 180, 180), start, end, width)
-                elif self.camera.zoom > 0.7:
-                    # Normal hex borders
-                    color = (32, 32, 32)  # Dark gray for normal
-                    width = max(1, int(self.camera.zoom))
-                    pygame.draw.line(self.screen, color, start, end, width)
-                else:
-                    continue  # Skip borders when zoomed out too far
+
+        # Calculate visible area in world coordinates
+        padding = self.world.hex_size * 2 / self.camera.zoom
+        left = self.camera.x - padding
+        top = self.camera.y - padding
+        right = self.camera.x + self.screen_size[0] / self.camera.zoom + padding
+        bottom = self.camera.y + self.screen_size[1] / self.camera.zoom + padding
+
+        # The candidate hex range follows directly from the grid spacing;
+        # one extra ring absorbs the half-row stagger of odd columns
+        start_col = int(left / self.world.hex_horiz_spacing) - 1
+        end_col = int(right / self.world.hex_horiz_spacing) + 1
+        start_row = int(top / self.world.hex_vert_spacing) - 1
+        end_row = int(bottom / self.world.hex_vert_spacing) + 1
+
+        # Precompute zoom-scaled vertex offsets and their bounding box once per
+        # frame; zoom is constant across the whole hex scan
+        zoom = self.camera.zoom
+        scaled_verts = [(vx * zoom, vy * zoom) for vx, vy in self.world.hex_vert]
+        min_dx, max_dx, min_dy, max_dy = _bbox6(scaled_verts)
+
+        # Compute all candidate hex centers and their screen positions in one
+        # NumPy pass. Centers are derived by formula rather than lookup because
+        # the world repeats spatially: off-grid hexes draw at unwrapped
+        # positions with wrapped terrain
+        cols = np.arange(start_col, end_col + 1)
+        rows = np.arange(start_row, end_row + 1)
+        world_cx = cols * self.world.hex_horiz_spacing
+        world_cy = (rows[:, None] - (cols[None, :] & 1) * 0.5) * self.world.hex_vert_spacing
+
+        # The world->screen transform is an affine with frame-constant
+        # parameters: fold the camera offset into a single scale-and-shift
+        ox = -self.camera.x * zoom
+        oy = -self.camera.y * zoom
+        screen_cx = world_cx * zoom + ox  # (C,)
+        screen_cy = world_cy * zoom + oy  # (R, C)
+
+        # Cull against the padded screen rectangle using the scaled-offset
+        # bounding box; one boolean mask replaces per-hex Python comparisons
+        pad = self.world.hex_size
+        col_mask = ((screen_cx + max_dx >= -pad) &
+                    (screen_cx + min_dx <= self.screen_size[0] + pad))
+        hex_mask = (col_mask[None, :] &
+                    (screen_cy + max_dy >= -pad) &
+                    (screen_cy + min_dy <= self.screen_size[1] + pad))
+        visible_i, visible_j = np.nonzero(hex_mask)
+
+        # First pass: Draw hex fills, sorting each hex into its border group
+        # as we go so the border pass runs branch-free loops
+        draw_normal = self.camera.zoom > 0.7
+        selected_group = []
+        hovered_group = []
+        normal_group = []
+        hovered_hex = self.hovered_hex if not self.dragging else None
+        for i, j in zip(visible_i.tolist(), visible_j.tolist()):
+            row = start_row + i
+            col = start_col + j
+            screen_x = screen_cx[j]
+            screen_y = screen_cy[i, j]
+            vertices = [(screen_x + dx, screen_y + dy) for dx, dy in scaled_verts]
+
+            # Get terrain type for this hex
+            wrapped_col = col % self.world.width
+            wrapped_row = row % self.world.height
+            terrain_type = self.world.get_terrain_type(self.world.terrain[wrapped_row][wrapped_col])
+
+            # Blit the cached tile for this appearance; the sprite already
+            # carries the ownership tint and improvement icon
+            hex_data = self.game_state.peek_hex_data(col, row)
+            tile = self._get_hex_tile(terrain_type, hex_data.owner, hex_data.improvement)
+            self.screen.blit(tile, (screen_x + min_dx, screen_y + min_dy))
+
+            # Store for border rendering
+            hex_coord = (col, row)
+            if hex_coord == self.selected_hex:
+                selected_group.append(vertices)
+            elif hex_coord == hovered_hex:
+                hovered_group.append(vertices)
+            elif draw_normal:
+                normal_group.append(vertices)
+
+        # Second pass: Draw borders, one homogeneous loop per group.
+        # Normal borders are deduplicated so each edge shared by two
+        # neighbors is drawn once instead of twice; they are skipped
+        # entirely when zoomed out too far
+        if draw_normal:
+            normal_edges = set()
+            for vertices in normal_group:
+                # Collect canonicalized edges; rounding keys absorbs float
+                # jitter between the two neighbors' copies of an edge
+                prev_key = (round(vertices[-1][0], 1), round(vertices[-1][1], 1))
+                for vx, vy in vertices:
+                    key = (round(vx, 1), round(vy, 1))
+                    normal_edges.add((prev_key, key) if prev_key <= key else (key, prev_key))
+                    prev_key = key
+
+            width = max(1, int(self.camera.zoom))
+            for start, end in normal_edges:
+                pygame.draw.line(self.screen, (32, 32, 32), start, end, width)
+
+        for vertices in hovered_group:
+            # Draw a more visible hover effect: outer glow, then main border
+            width = max(2, int(self.camera.zoom * 2))
+            pygame.draw.lines(self.screen, (140, 140, 140), True, vertices, width + 2)
+            pygame.draw.lines(self.screen, (180, 180, 180), True, vertices, width)
+
+        for vertices in selected_group:
+            # Draw a thicker white border for selected hex: glow, then main
+            width = max(3, int(self.camera.zoom * 2.5))
+            pygame.draw.lines(self.screen, (200, 200, 200), True, vertices, width + 2)
+            pygame.draw.lines(self.screen, (255, 255, 255), True, vertices, width)
         
         # Render UI elements
         self._render_game_info()
@@ -377,31 +495,24 @@ class GameEngine:
         
         # Render action buttons
         for button in self.action_buttons:
-            # Draw button background
-            color = (70, 70, 70) if button['hover'] else (50, 50, 50)
+            # Blit the pre-rendered background for this button state
+            disabled = False
             if button['action'] == 'claim':
                 # Show if claims are available
                 claims_left = (self.game_state.MAX_CLAIMS_PER_TURN - 
                              self.game_state.current_player.claims_this_turn)
-                if claims_left <= 0:
-                    color = (40, 40, 40)  # Darker if no claims left
-            pygame.draw.rect(self.screen, color, button['rect'])
-            
-            # Draw button border
-            border_color = (200, 200, 200) if button['hover'] else (100, 100, 100)
-            pygame.draw.rect(self.screen, border_color, button['rect'], 2)
+                disabled = claims_left <= 0
+            bg = self._button_bg(button['rect'].size, button['hover'], disabled)
+            self.screen.blit(bg, button['rect'].topleft)
             
             # Draw button text
-            font = pygame.font.Font(None, 24)
-            text = font.render(button['text'], True, (255, 255, 255))
+            text = self._text(button['text'], 24)
             text_rect = text.get_rect(center=button['rect'].center)
             self.screen.blit(text, text_rect)
             
             # Show resource cost if it's an improvement button
-            if isinstance(button['action'], ImprovementType):
-                costs = self.game_state.IMPROVEMENT_COSTS[button['action']]
-                cost_text = ", ".join(f"{amount} {res.value}" for res, amount in costs.items())
-                cost_surface = font.render(cost_text, True, (200, 200, 200))
+            cost_surface = button.get('cost_surface')
+            if cost_surface is not None:
                 cost_rect = cost_surface.get_rect(
                     midtop=(button['rect'].centerx, button['rect'].bottom + 5)
                 )
@@ -411,7 +522,7 @@ class GameEngine:
                 claims_left = (self.game_state.MAX_CLAIMS_PER_TURN - 
                              self.game_state.current_player.claims_this_turn)
                 status_text = f"Claims left: {claims_left}"
-                status_surface = font.render(status_text, True, (200, 200, 200))
+                status_surface = self._text(status_text, 24, (200, 200, 200))
                 status_rect = status_surface.get_rect(
                     midtop=(button['rect'].centerx, button['rect'].bottom + 5)
                 )
@@ -430,51 +541,109 @@ class GameEngine:
         
         pygame.display.flip()
         
+    def _get_hex_tile(self, terrain_type: TerrainType, owner: Optional[int],
+                      improvement: Optional[ImprovementType]) -> pygame.Surface:
+        """Get the cached tile sprite for a hex appearance at the current zoom"""
+        zoom = self.camera.zoom
+        if zoom != self._tile_cache_zoom:
+            # Tiles are rasterized at the live zoom so they line up exactly
+            # with the vertex grid; a zoom change invalidates them all
+            self._tile_cache.clear()
+            self._tile_cache_zoom = zoom
+        
+        key = (terrain_type, owner, improvement)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            scaled = [(vx * zoom, vy * zoom) for vx, vy in self.world.hex_vert]
+            min_dx, max_dx, min_dy, max_dy = _bbox6(scaled)
+            width = int(max_dx - min_dx) + 1
+            height = int(max_dy - min_dy) + 1
+            
+            tile = pygame.Surface((width, height), pygame.SRCALPHA)
+            vertices = [(dx - min_dx, dy - min_dy) for dx, dy in scaled]
+            if owner is not None:
+                color = self._blended_colors[owner, terrain_type]
+            else:
+                color = PALETTE[terrain_type].tolist()
+            pygame.draw.polygon(tile, color, vertices)
+            
+            if improvement:
+                icon = self._get_icon(improvement, zoom)
+                tile.blit(icon, (-min_dx - icon.get_width() // 2,
+                                 -min_dy - icon.get_height() // 2))
+            
+            self._tile_cache[key] = tile
+        return tile
+
+    def _get_icon(self, improvement: ImprovementType, zoom: float) -> pygame.Surface:
+        """Get the cached icon sprite for an improvement at this zoom level"""
+        # Quantize zoom into discrete buckets so a handful of sprites covers
+        # the whole zoom range
+        bucket = int(zoom * 8)
+        key = (improvement, bucket)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon_size = max(20, int(20 * bucket / 8))
+            icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
+            icon_rect = icon.get_rect()
+            
+            # Different shapes for different improvements
+            if improvement is ImprovementType.SETTLEMENT:
+                pygame.draw.polygon(icon, (255, 255, 255), [
+                    (icon_size // 2, 0),  # Top
+                    (icon_size, icon_size),  # Bottom right
+                    (0, icon_size),  # Bottom left
+                ])
+            elif improvement is ImprovementType.FARM:
+                pygame.draw.rect(icon, (255, 255, 0), icon_rect)
+            elif improvement is ImprovementType.LUMBER_CAMP:
+                pygame.draw.rect(icon, (139, 69, 19), icon_rect)
+            elif improvement is ImprovementType.QUARRY:
+                pygame.draw.circle(icon, (169, 169, 169), icon_rect.center, icon_size // 2)
+            
+            self._icon_cache[key] = icon
+        return icon
+        
     def draw_improvement_icon(self, x: float, y: float, improvement: ImprovementType):
-        """Draw an icon representing the improvement"""
-        icon_size = max(20, int(20 * self.camera.zoom))
-        icon_rect = pygame.Rect(x - icon_size//2, y - icon_size//2, icon_size, icon_size)
-        
-        # Different shapes for different improvements
-        if improvement == ImprovementType.SETTLEMENT:
-            pygame.draw.polygon(self.screen, (255, 255, 255), [
-                (x, y - icon_size//2),  # Top
-                (x + icon_size//2, y + icon_size//2),  # Bottom right
-                (x - icon_size//2, y + icon_size//2),  # Bottom left
-            ])
-        elif improvement == ImprovementType.FARM:
-            pygame.draw.rect(self.screen, (255, 255, 0), icon_rect)
-        elif improvement == ImprovementType.LUMBER_CAMP:
-            pygame.draw.rect(self.screen, (139, 69, 19), icon_rect)
-        elif improvement == ImprovementType.QUARRY:
-            pygame.draw.circle(self.screen, (169, 169, 169), (x, y), icon_size//2)
+        """Blit the icon representing the improvement, centered on the hex"""
+        icon = self._get_icon(improvement, self.camera.zoom)
+        self.screen.blit(icon, (x - icon.get_width() // 2, y - icon.get_height() // 2))
             
     def _render_game_info(self):
         """Render game state information"""
-        font = pygame.font.Font(None, 24)
         current_player = self.game_state.current_player
+        state_key = (
+            self.game_state.turn_number,
+            current_player.id,
+            int(current_player.resources[ResourceType.FOOD]),
+            int(current_player.resources[ResourceType.WOOD]),
+            int(current_player.resources[ResourceType.STONE]),
+        )
         
-        # Create a semi-transparent panel
-        panel_surface = pygame.Surface((200, 150))
-        panel_surface.fill((50, 50, 50))
-        panel_surface.set_alpha(200)
-        self.screen.blit(panel_surface, (10, 10))
-        
-        # Render text
-        texts = [
-            f"Turn: {self.game_state.turn_number}",
-            f"Player: {current_player.id + 1}",
-            "Resources:",
-            f"  Food: {current_player.resources[ResourceType.FOOD]}",
-            f"  Wood: {current_player.resources[ResourceType.WOOD]}",
-            f"  Stone: {current_player.resources[ResourceType.STONE]}",
-            "",
-            "Space: End Turn"
-        ]
-        
-        for i, text in enumerate(texts):
-            text_surface = font.render(text, True, (255, 255, 255))
-            self.screen.blit(text_surface, (20, 20 + i * 20))
+        cached = self._panel_cache.get('game_info')
+        if cached is None or cached[0] != state_key:
+            # Compose the semi-transparent panel and its text once per state
+            panel_surface = pygame.Surface((200, 150), pygame.SRCALPHA)
+            panel_surface.fill((50, 50, 50, 200))
+            
+            texts = [
+                f"Turn: {self.game_state.turn_number}",
+                f"Player: {current_player.id + 1}",
+                "Resources:",
+                f"  Food: {current_player.resources[ResourceType.FOOD]}",
+                f"  Wood: {current_player.resources[ResourceType.WOOD]}",
+                f"  Stone: {current_player.resources[ResourceType.STONE]}",
+                "",
+                "Space: End Turn"
+            ]
+            
+            for i, text in enumerate(texts):
+                panel_surface.blit(self._text(text, 24), (10, 10 + i * 20))
+            
+            cached = (state_key, panel_surface)
+            self._panel_cache['game_info'] = cached
+        
+        self.screen.blit(cached[1], (10, 10))
             
     def _render_selected_hex_info(self):
         """Render information about the selected hex"""
@@ -482,30 +651,33 @@ class GameEngine:
             return
             
         col, row = self.selected_hex
-        hex_data = self.game_state.get_hex_data(col, row)
+        hex_data = self.game_state.peek_hex_data(col, row)
         terrain_value = self.world.terrain[row % self.world.height][col % self.world.width]
         terrain_type = self.world.get_terrain_type(terrain_value)
+        state_key = (col, row, terrain_type, hex_data.owner, hex_data.improvement)
         
-        # Create a semi-transparent info panel
-        panel_surface = pygame.Surface((200, 120))
-        panel_surface.fill((50, 50, 50))
-        panel_surface.set_alpha(200)
-        self.screen.blit(panel_surface, (10, 170))
-        
-        # Render text
-        font = pygame.font.Font(None, 24)
-        texts = [
-            f"Hex: ({col}, {row})",
-            f"Terrain: {terrain_type.name}",
-            f"Owner: {'None' if hex_data.owner is None else f'Player {hex_data.owner + 1}'}",
-            f"Improvement: {hex_data.improvement.name if hex_data.improvement else 'None'}",
-            "",
-            "Right Click: Build Menu"
-        ]
-        
-        for i, text in enumerate(texts):
-            text_surface = font.render(text, True, (255, 255, 255))
-            self.screen.blit(text_surface, (20, 180 + i * 20))
+        cached = self._panel_cache.get('selected_hex')
+        if cached is None or cached[0] != state_key:
+            # Compose the semi-transparent info panel once per state
+            panel_surface = pygame.Surface((200, 120), pygame.SRCALPHA)
+            panel_surface.fill((50, 50, 50, 200))
+            
+            texts = [
+                f"Hex: ({col}, {row})",
+                f"Terrain: {terrain_type.name}",
+                f"Owner: {'None' if hex_data.owner is None else f'Player {hex_data.owner + 1}'}",
+                f"Improvement: {hex_data.improvement.name if hex_data.improvement else 'None'}",
+                "",
+                "Right Click: Build Menu"
+            ]
+            
+            for i, text in enumerate(texts):
+                panel_surface.blit(self._text(text, 24), (10, 10 + i * 20))
+            
+            cached = (state_key, panel_surface)
+            self._panel_cache['selected_hex'] = cached
+        
+        self.screen.blit(cached[1], (10, 170))
             
     def _render_build_menu(self):
         """Render the build menu"""
@@ -523,8 +695,7 @@ class GameEngine:
         self.screen.blit(panel_surface, (menu_x, 100))
         
         # Render title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Build Improvement", True, (255, 255, 255))
+        title = self._text("Build Improvement", 24)
         self.screen.blit(title, (menu_x + 10, 110))
         
         # Render improvement options
@@ -537,13 +708,13 @@ class GameEngine:
                 pygame.draw.rect(self.screen, (70, 70, 70), option_rect)
             
             # Render improvement name and cost
-            name = font.render(improvement.value, True, (255, 255, 255))
+            name = self._text(improvement.value, 24)
             self.screen.blit(name, (menu_x + 10, y + 5))
             
             # Render cost
             costs = self.game_state.IMPROVEMENT_COSTS[improvement]
-            cost_text = ", ".join(f"{amount} {res.value}" for res, amount in costs.items())
-            cost_surface = font.render(cost_text, True, (200, 200, 200))
+            cost_text = ", ".join(f"{amount} {res.label}" for res, amount in costs.items())
+            cost_surface = self._text(cost_text, 24, (200, 200, 200))
             self.screen.blit(cost_surface, (menu_x + 100, y + 5))
             
     def _render_action_log(self):
@@ -552,23 +723,29 @@ class GameEngine:
         if not log_entries:
             return
             
-        # Create log panel
+        state_key = tuple(log_entries)
         panel_height = len(log_entries) * 20 + 20
-        panel_surface = pygame.Surface((400, panel_height))
-        panel_surface.fill((30, 30, 30))
-        panel_surface.set_alpha(200)
+        
+        cached = self._panel_cache.get('action_log')
+        if cached is None or cached[0] != state_key:
+            # Compose the log panel once per batch of entries
+            panel_surface = pygame.Surface((400, panel_height), pygame.SRCALPHA)
+            panel_surface.fill((30, 30, 30, 200))
+            
+            # Entries are rendered straight onto the panel: they are unique
+            # strings, so routing them through the shared text cache would
+            # only grow it without ever hitting
+            font = self._fonts[20]
+            for i, entry in enumerate(log_entries):
+                panel_surface.blit(font.render(entry, True, (200, 200, 200)), (10, 10 + i * 20))
+            
+            cached = (state_key, panel_surface)
+            self._panel_cache['action_log'] = cached
         
         # Position log panel above the action buttons
         panel_x = 10
         panel_y = self.screen_size[1] - panel_height - 70  # Above action buttons
-        
-        self.screen.blit(panel_surface, (panel_x, panel_y))
-        
-        # Render log entries
-        font = pygame.font.Font(None, 20)
-        for i, entry in enumerate(log_entries):
-            text = font.render(entry, True, (200, 200, 200))
-            self.screen.blit(text, (panel_x + 10, panel_y + 10 + i * 20))
+        self.screen.blit(cached[1], (panel_x, panel_y))
         
     def _render_escape_menu(self):
         """Render the escape menu overlay"""
@@ -579,8 +756,7 @@ class GameEngine:
         self.screen.blit(overlay, (0, 0))
         
         # Render menu title
-        font = pygame.font.Font(None, 48)
-        title = font.render("Game Menu", True, (255, 255, 255))
+        title = self._text("Game Menu", 48)
         title_rect = title.get_rect(
             centerx=self.screen_size[0] // 2,
             centery=self.screen_size[1] // 2 - 100
@@ -589,17 +765,12 @@ class GameEngine:
         
         # Render buttons
         for button in self.escape_menu_buttons:
-            # Draw button background
-            color = (70, 70, 70) if button['hover'] else (50, 50, 50)
-            pygame.draw.rect(self.screen, color, button['rect'])
-            
-            # Draw button border
-            border_color = (200, 200, 200) if button['hover'] else (100, 100, 100)
-            pygame.draw.rect(self.screen, border_color, button['rect'], 2)
+            # Blit the pre-rendered background for this button state
+            bg = self._button_bg(button['rect'].size, button['hover'])
+            self.screen.blit(bg, button['rect'].topleft)
             
             # Draw button text
-            font = pygame.font.Font(None, 36)
-            text = font.render(button['text'], True, (255, 255, 255))
+            text = self._text(button['text'], 36)
             text_rect = text.get_rect(center=button['rect'].center)
             self.screen.blit(text, text_rect)
         
@@ -625,23 +796,25 @@ class GameEngine:
             message = "It's a Tie!"
             message_color = (255, 255, 255)
             
-        text = self.victory_font.render(message, True, message_color)
+        # Text goes through the cache, so the glyphs rasterize once at
+        # game over rather than on every frame
+        text = self._text(message, 74, message_color)
         text_rect = text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 - 50))
         self.screen.blit(text, text_rect)
-        
+
         # Render points
         if self.game_state.winner:
             points = self.game_state.calculate_player_points(self.game_state.winner)
-            points_text = self.button_font.render(f"Points: {points}", True, message_color)
+            points_text = self._text(f"Points: {points}", 36, message_color)
             points_rect = points_text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 + 20))
             self.screen.blit(points_text, points_rect)
-        
+
         # Render quit button
         button_rect = self._get_victory_quit_button()
         pygame.draw.rect(self.screen, (100, 100, 100), button_rect)
         pygame.draw.rect(self.screen, (200, 200, 200), button_rect, 2)
-        
-        quit_text = self.button_font.render("Quit Game", True, (255, 255, 255))
+
+        quit_text = self._text("Quit Game", 36)
         quit_rect = quit_text.get_rect(center=button_rect.center)
         self.screen.blit(quit_text, quit_rect)
 
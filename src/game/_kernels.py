@@ -0,0 +1,32 @@
+"""Numba-compiled kernels for the hot game-state predicates"""
+import numpy as np
+from numba import njit
+
+# The 13 offsets with |dc| + |dr| <= 2, folded at import so the kernel
+# never evaluates the abs/skip checks
+_DIAMOND_OFFSETS = tuple(
+    (dc, dr)
+    for dc in range(-2, 3)
+    for dr in range(-2, 3)
+    if abs(dc) + abs(dr) <= 2
+)
+
+@njit(cache=True)
+def can_claim(owner_grid, improvement_grid, col, row, player_id, settlement_id):
+    """Is a settlement owned by player_id within 2 hexes of (col, row)?
+
+    Walks the precomputed diamond offsets on the wrapped grids and
+    short-circuits on the first hit.
+    """
+    grid_cols, grid_rows = owner_grid.shape
+    for dc, dr in _DIAMOND_OFFSETS:
+        c = (col + dc) % grid_cols
+        r = (row + dr) % grid_rows
+        if owner_grid[c, r] == player_id and improvement_grid[c, r] == settlement_id:
+            return True
+    return False
+
+# Warm up the JIT at import so the first turn doesn't pay the compile cost
+_dummy = np.full((8, 8), -1, dtype=np.int8)
+can_claim(_dummy, _dummy, 4, 4, 0, 0)
+del _dummy
@@ -12,70 +12,87 @@ class GameEngine:
         self.game_state = GameState()
         self.victory_font = pygame.font.Font(None, 74)  # Large font for victory message
         self.button_font = pygame.font.Font(None, 36)  # Smaller font for buttons
-        
+        self._victory_cache = None  # (surface, quit button rect) built at game over
+        self._dirty = True  # Redraw only after input changes the state
+
+        # Only the event types we act on are allowed into the queue; the
+        # rest (mouse-motion spam in particular) are dropped inside SDL
+        # instead of being built into Python objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
+
     def run(self):
         """Main game loop"""
         while self.running:
-            # Handle events
-            for event in pygame.event.get():
+            # Handle events, pumping once and pulling only the allowed types
+            pygame.event.pump()
+            for event in pygame.event.get([pygame.QUIT, pygame.MOUSEBUTTONDOWN]):
                 if event.type == pygame.QUIT:
                     self.running = False
                 else:
                     self.handle_input(event)
-            
-            # Update and render
-            self.render()
+                    self._dirty = True
+
+            # The game is turn-based, so frames between inputs are
+            # identical; skip the redraw until something changes
+            if self._dirty:
+                self.render()
+                self._dirty = False
             self.clock.tick(self.fps)
         
         pygame.quit()
         
     def render_victory_screen(self):
         """Render the victory screen with darkened background"""
-        # Create a semi-transparent dark overlay
-        overlay = pygame.Surface(self.screen_size)
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Render victory message
-        if self.game_state.winner:
-            message = f"Player {self.game_state.winner.id + 1} Wins!"
-            message_color = self.game_state.winner.color
-        else:
-            message = "It's a Tie!"
-            message_color = (255, 255, 255)
+        if self._victory_cache is None:
+            # Compose the overlay, text and quit button once at game over;
+            # later frames and clicks reuse the cached surface
+            overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 128))
             
-        text = self.victory_font.render(message, True, message_color)
-        text_rect = text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 - 50))
-        self.screen.blit(text, text_rect)
-        
-        # Render points
-        if self.game_state.winner:
-            points = self.game_state.calculate_player_points(self.game_state.winner)
-            points_text = self.button_font.render(f"Points: {points}", True, message_color)
-            points_rect = points_text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 + 20))
-            self.screen.blit(points_text, points_rect)
-        
-        # Render quit button
-        button_rect = pygame.Rect(0, 0, 200, 50)
-        button_rect.center = (self.screen_size[0] // 2, self.screen_size[1] // 2 + 100)
-        pygame.draw.rect(self.screen, (100, 100, 100), button_rect)
-        pygame.draw.rect(self.screen, (200, 200, 200), button_rect, 2)
-        
-        quit_text = self.button_font.render("Quit Game", True, (255, 255, 255))
-        quit_rect = quit_text.get_rect(center=button_rect.center)
-        self.screen.blit(quit_text, quit_rect)
+            # Render victory message
+            if self.game_state.winner:
+                message = f"Player {self.game_state.winner.id + 1} Wins!"
+                message_color = self.game_state.winner.color
+            else:
+                message = "It's a Tie!"
+                message_color = (255, 255, 255)
+                
+            text = self.victory_font.render(message, True, message_color)
+            text_rect = text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 - 50))
+            overlay.blit(text, text_rect)
+            
+            # Render points
+            if self.game_state.winner:
+                points = self.game_state.calculate_player_points(self.game_state.winner)
+                points_text = self.button_font.render(f"Points: {points}", True, message_color)
+                points_rect = points_text.get_rect(center=(self.screen_size[0] // 2, self.screen_size[1] // 2 + 20))
+                overlay.blit(points_text, points_rect)
+            
+            # Render quit button
+            button_rect = pygame.Rect(0, 0, 200, 50)
+            button_rect.center = (self.screen_size[0] // 2, self.screen_size[1] // 2 + 100)
+            pygame.draw.rect(overlay, (100, 100, 100), button_rect)
+            pygame.draw.rect(overlay, (200, 200, 200), button_rect, 2)
+            
+            quit_text = self.button_font.render("Quit Game", True, (255, 255, 255))
+            quit_rect = quit_text.get_rect(center=button_rect.center)
+            overlay.blit(quit_text, quit_rect)
+            
+            self._victory_cache = (overlay.convert_alpha(), button_rect)
         
+        surface, button_rect = self._victory_cache
+        self.screen.blit(surface, (0, 0))
         return button_rect  # Return the rect for click detection
         
     def handle_input(self, event):
         """Handle input events"""
         if self.game_state.game_over:
-            # Only handle quit button clicks when game is over
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
+            # Only handle quit button clicks when game is over; the button
+            # rect is read from the cached victory screen without redrawing
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self._victory_cache:  # Left click
                 mouse_pos = pygame.mouse.get_pos()
-                quit_button = self.render_victory_screen()  # Get the button rect
-                if quit_button.collidepoint(mouse_pos):
+                if self._victory_cache[1].collidepoint(mouse_pos):
                     self.running = False
             return
             
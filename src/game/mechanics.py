@@ -1,8 +1,13 @@
-from enum import Enum, auto
-from typing import Dict, Optional, Tuple, List
+from collections import deque
+from enum import Enum, IntEnum, auto
+from typing import Callable, Dict, Optional, Tuple, List
 from dataclasses import dataclass
 import random
-from datetime import datetime
+import sys
+import time
+import numpy as np
+
+from game._kernels import can_claim as _can_claim
 
 class GameAction(Enum):
     CLAIM_HEX = auto()
@@ -13,14 +18,29 @@ class GameAction(Enum):
 class GameEvent:
     action: GameAction
     player_id: int
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() at the moment of the action
     turn_number: int
     data: Dict  # Stores action-specific data
 
-class ResourceType(Enum):
-    FOOD = "food"
-    WOOD = "wood"
-    STONE = "stone"
+class ResourceType(IntEnum):
+    FOOD = 0
+    WOOD = 1
+    STONE = 2
+    
+    @property
+    def label(self) -> str:
+        """Display name used in the UI and logs"""
+        return _RES_NAME[self]
+
+# Interned display-name tables so logging doesn't allocate fresh strings
+_RES_NAME = {res: sys.intern(res.name.lower()) for res in ResourceType}
+
+def _resource_vec(amounts: Dict['ResourceType', int]) -> np.ndarray:
+    """Pack a sparse resource mapping into a dense per-type vector"""
+    vec = np.zeros(len(ResourceType), dtype=np.int32)
+    for res_type, amount in amounts.items():
+        vec[res_type] = amount
+    return vec
     
 class ImprovementType(Enum):
     FARM = "farm"  # Generates food
@@ -28,7 +48,15 @@ class ImprovementType(Enum):
     QUARRY = "quarry"  # Generates stone
     SETTLEMENT = "settlement"  # Required to claim nearby hexes
 
-@dataclass
+# Small integer ids so improvements can live in compact numpy grids
+_IMPROVEMENT_ID = {improvement: i for i, improvement in enumerate(ImprovementType)}
+_SETTLEMENT = ImprovementType.SETTLEMENT
+_SETTLEMENT_ID = _IMPROVEMENT_ID[_SETTLEMENT]
+
+_IMP_NAME = {improvement: sys.intern(improvement.value) for improvement in ImprovementType}
+_PLAYER_TAG = ("Player 1", "Player 2")
+
+@dataclass(slots=True)
 class HexData:
     owner: Optional[int] = None  # Player ID who owns this hex
     improvement: Optional[ImprovementType] = None
@@ -36,32 +64,52 @@ class HexData:
     def can_build(self, improvement: ImprovementType) -> bool:
         return self.improvement is None
 
+# Shared blank returned for hexes nobody has touched; read-only probes
+# must not mutate it
+_EMPTY_HEX = HexData()
+
 class Player:
     def __init__(self, player_id: int, color: Tuple[int, int, int]):
         self.id = player_id
         self.color = color
-        self.resources = {
-            ResourceType.FOOD: 10,
-            ResourceType.WOOD: 10,
-            ResourceType.STONE: 10
-        }
-        self.owned_hexes = set()  # Set of (col, row) tuples
+        # Stockpile as a dense vector indexed by ResourceType
+        self.resources = np.full(len(ResourceType), 10, dtype=np.int32)
+        # Owned hexes as packed (col << 16 | row) keys in a flat buffer
+        # grown by doubling; avoids a tuple set in the turn-end hot loop
+        self._owned_buf = np.empty(16, dtype=np.uint32)
+        self._owned_n = 0
+        self.settlements = set()  # Owned (col, row) hexes with a settlement built
         self.claims_this_turn = 0  # Track number of claims in current turn
-        
-    def can_afford(self, costs: Dict[ResourceType, int]) -> bool:
-        return all(self.resources.get(res_type, 0) >= amount 
-                  for res_type, amount in costs.items())
+        self.points = 0  # Running score, updated on claim/build
+
+    def add_hex(self, col: int, row: int):
+        """Record ownership of a hex (grid-wrapped coordinates)"""
+        if self._owned_n == len(self._owned_buf):
+            self._owned_buf = np.concatenate([self._owned_buf, np.empty_like(self._owned_buf)])
+        self._owned_buf[self._owned_n] = (col << 16) | row
+        self._owned_n += 1
+
+    def owned_keys(self) -> np.ndarray:
+        """The packed keys of all owned hexes as a live array view"""
+        return self._owned_buf[:self._owned_n]
+
+    @property
+    def owned_hexes(self) -> set:
+        """Owned hexes as (col, row) tuples, decoded for occasional callers"""
+        keys = self.owned_keys()
+        return {(int(key >> 16), int(key & 0xFFFF)) for key in keys}
+
+    def can_afford(self, cost_vec: np.ndarray) -> bool:
+        return bool((self.resources >= cost_vec).all())
                   
-    def spend_resources(self, costs: Dict[ResourceType, int]) -> bool:
-        if not self.can_afford(costs):
+    def spend_resources(self, cost_vec: np.ndarray) -> bool:
+        if not self.can_afford(cost_vec):
             return False
-        for res_type, amount in costs.items():
-            self.resources[res_type] -= amount
+        self.resources -= cost_vec
         return True
         
-    def add_resources(self, gains: Dict[ResourceType, int]):
-        for res_type, amount in gains.items():
-            self.resources[res_type] = self.resources.get(res_type, 0) + amount
+    def add_resources(self, gain_vec: np.ndarray):
+        self.resources += gain_vec
 
 class GameState:
     # Improvement costs
@@ -98,7 +146,11 @@ class GameState:
     
     # Game rules
     MAX_CLAIMS_PER_TURN = 1
-    
+
+    # Ownership/improvement grid bounds; hex coordinates wrap into these
+    GRID_COLS = 128
+    GRID_ROWS = 128
+
     def __init__(self):
         self.players = [
             Player(0, (200, 0, 0)),    # Red player
@@ -106,11 +158,18 @@ class GameState:
         ]
         self.current_player_idx = 0
         self.hex_data = {}  # Dict of (col, row) -> HexData
+        # Dense mirrors of hex_data for the hot neighborhood predicates;
+        # -1 means unowned / no improvement
+        self.owner_grid = np.full((self.GRID_COLS, self.GRID_ROWS), -1, dtype=np.int8)
+        self.improvement_grid = np.full((self.GRID_COLS, self.GRID_ROWS), -1, dtype=np.int8)
         self.turn_number = 1
-        self.action_log: List[str] = []  # Human-readable log
-        self.game_events: List[GameEvent] = []  # Machine-readable events
+        # Human-readable log as a ring buffer; only the tail is ever shown
+        self.action_log: deque = deque(maxlen=256)
+        self.game_events: List[GameEvent] = []  # Machine-readable events, kept whole for replay
         self.game_over = False
         self.winner = None
+        # Headless/bot play can turn this off to skip building log strings
+        self.verbose_log = True
         
     @property
     def current_player(self) -> Player:
@@ -122,44 +181,46 @@ class GameState:
         if key not in self.hex_data:
             self.hex_data[key] = HexData()
         return self.hex_data[key]
-    
+
+    def peek_hex_data(self, col: int, row: int) -> HexData:
+        """Read hex data without creating an entry for untouched hexes"""
+        return self.hex_data.get((col, row), _EMPTY_HEX)
+
     def can_claim_hex(self, col: int, row: int) -> bool:
         """Check if current player can claim this hex"""
+        player = self.current_player
+
         # Check claims per turn limit
-        if self.current_player.claims_this_turn >= self.MAX_CLAIMS_PER_TURN:
+        if player.claims_this_turn >= self.MAX_CLAIMS_PER_TURN:
             return False
-            
-        hex_data = self.get_hex_data(col, row)
-        if hex_data.owner is not None:
+
+        if self.owner_grid[col % self.GRID_COLS, row % self.GRID_ROWS] != -1:
             return False
-            
+
         # If player has no settlements yet, they can claim any hex
-        has_any_settlement = any(
-            self.get_hex_data(c, r).improvement == ImprovementType.SETTLEMENT
-            for c, r in self.current_player.owned_hexes
-        )
-        
-        if not has_any_settlement:
+        if not player.settlements:
             return True
-            
-        # Must have a settlement within 2 hexes
-        for dc in range(-2, 3):
-            for dr in range(-2, 3):
-                if abs(dc) + abs(dr) > 2:
-                    continue
-                neighbor_data = self.get_hex_data(col + dc, row + dr)
-                if (neighbor_data.owner == self.current_player.id and 
-                    neighbor_data.improvement == ImprovementType.SETTLEMENT):
-                    return True
-        return False
+
+        # Must have a settlement within 2 hexes: jitted scan over the grids
+        return _can_claim(
+            self.owner_grid, self.improvement_grid,
+            col % self.GRID_COLS, row % self.GRID_ROWS,
+            player.id, _SETTLEMENT_ID
+        )
     
-    def log_action(self, message: str, action: GameAction, data: Dict):
-        """Log an action both for display and replay"""
-        timestamp = datetime.now().timestamp()
-        
+    def log_action(self, msg_factory: Callable[[], str], action: GameAction, data: Dict):
+        """Log an action both for display and replay
+
+        msg_factory builds the human-readable message; it is only invoked
+        when verbose logging is on, so failure-path f-strings cost nothing
+        for headless play.
+        """
+        timestamp = time.monotonic_ns()
+
         # Add human-readable log
-        self.action_log.append(f"Turn {self.turn_number} - Player {self.current_player.id + 1}: {message}")
-        
+        if self.verbose_log:
+            self.action_log.append(f"Turn {self.turn_number} - {_PLAYER_TAG[self.current_player.id]}: {msg_factory()}")
+
         # Add machine-readable event
         event = GameEvent(
             action=action,
@@ -172,7 +233,8 @@ class GameState:
         
     def get_recent_logs(self, count: int = 5) -> List[str]:
         """Get the most recent log messages"""
-        return self.action_log[-count:]
+        start = max(0, len(self.action_log) - count)
+        return [self.action_log[i] for i in range(start, len(self.action_log))]
     
     def claim_hex(self, col: int, row: int) -> bool:
         """Attempt to claim a hex for the current player"""
@@ -181,7 +243,7 @@ class GameState:
             
         if not self.can_claim_hex(col, row):
             self.log_action(
-                f"Failed to claim hex at ({col}, {row})" + 
+                lambda: f"Failed to claim hex at ({col}, {row})" +
                 (" - No claims remaining this turn" if self.current_player.claims_this_turn >= self.MAX_CLAIMS_PER_TURN else ""),
                 GameAction.CLAIM_HEX,
                 {"col": col, "row": row, "success": False}
@@ -190,144 +252,170 @@ class GameState:
             
         hex_data = self.get_hex_data(col, row)
         hex_data.owner = self.current_player.id
-        self.current_player.owned_hexes.add((col, row))
+        self.owner_grid[col % self.GRID_COLS, row % self.GRID_ROWS] = self.current_player.id
+        self.current_player.add_hex(col % self.GRID_COLS, row % self.GRID_ROWS)
         self.current_player.claims_this_turn += 1
+        self.current_player.points += self.POINTS_PER_HEX
         
         self.log_action(
-            f"Claimed hex at ({col}, {row})",
+            lambda: f"Claimed hex at ({col}, {row})",
             GameAction.CLAIM_HEX,
             {"col": col, "row": row, "success": True}
         )
+        if self.current_player.points >= self.POINTS_TO_WIN:
+            self._declare_winner(self.current_player)
         return True
     
     def can_build(self, col: int, row: int, improvement: ImprovementType) -> bool:
         """Check if current player can build the improvement here"""
-        hex_data = self.get_hex_data(col, row)
+        hex_data = self.peek_hex_data(col, row)
         
         # Basic checks
         if (hex_data.owner != self.current_player.id or
             not hex_data.can_build(improvement) or
-            not self.current_player.can_afford(self.IMPROVEMENT_COSTS[improvement])):
+            not self.current_player.can_afford(self.IMPROVEMENT_COST_VEC[improvement])):
             return False
             
         # Special case for first settlement
-        if improvement == ImprovementType.SETTLEMENT:
-            has_any_settlement = any(
-                self.get_hex_data(c, r).improvement == ImprovementType.SETTLEMENT
-                for c, r in self.current_player.owned_hexes
-            )
-            if not has_any_settlement:
+        if improvement is _SETTLEMENT:
+            if not self.current_player.settlements:
                 return True
-            
+
             # For subsequent settlements, must be at least 4 hexes away from other settlements
-            for c, r in self.current_player.owned_hexes:
-                if self.get_hex_data(c, r).improvement == ImprovementType.SETTLEMENT:
-                    dx = abs(col - c)
-                    dy = abs(row - r)
-                    if dx + dy < 4:
-                        return False
-        
+            for c, r in self.current_player.settlements:
+                if abs(col - c) + abs(row - r) < 4:
+                    return False
+
         return True
     
+    def _build_failure_reason(self, col: int, row: int, improvement: ImprovementType) -> str:
+        """Explain why a build was rejected; only called for log messages"""
+        hex_data = self.peek_hex_data(col, row)
+
+        if hex_data.owner != self.current_player.id:
+            return "must own the hex"
+        if not hex_data.can_build(improvement):
+            return "hex already has an improvement"
+        if not self.current_player.can_afford(self.IMPROVEMENT_COST_VEC[improvement]):
+            return "insufficient resources"
+        if improvement is _SETTLEMENT and self.current_player.settlements:
+            return "too close to another settlement"
+        return ""
+
     def build_improvement(self, col: int, row: int, improvement: ImprovementType) -> bool:
         """Attempt to build an improvement on the hex"""
         if self.game_over:
             return False
             
         if not self.can_build(col, row, improvement):
-            reason = ""
-            hex_data = self.get_hex_data(col, row)
-            
-            if hex_data.owner != self.current_player.id:
-                reason = "must own the hex"
-            elif not hex_data.can_build(improvement):
-                reason = "hex already has an improvement"
-            elif not self.current_player.can_afford(self.IMPROVEMENT_COSTS[improvement]):
-                reason = "insufficient resources"
-            elif improvement == ImprovementType.SETTLEMENT:
-                has_any_settlement = any(
-                    self.get_hex_data(c, r).improvement == ImprovementType.SETTLEMENT
-                    for c, r in self.current_player.owned_hexes
-                )
-                if has_any_settlement:
-                    reason = "too close to another settlement"
-            
+            # The diagnostic chain runs inside the message factory, so the
+            # successful-build path (and silent headless play) never pays for it
             self.log_action(
-                f"Failed to build {improvement.value} at ({col}, {row}) - {reason}",
+                lambda: f"Failed to build {_IMP_NAME[improvement]} at ({col}, {row}) - "
+                        f"{self._build_failure_reason(col, row, improvement)}",
                 GameAction.BUILD_IMPROVEMENT,
-                {"col": col, "row": row, "improvement": improvement.value, "success": False}
+                {"col": col, "row": row, "improvement": _IMP_NAME[improvement], "success": False}
             )
             return False
             
         # Spend resources
-        if not self.current_player.spend_resources(self.IMPROVEMENT_COSTS[improvement]):
+        if not self.current_player.spend_resources(self.IMPROVEMENT_COST_VEC[improvement]):
             return False
             
         # Build improvement
         hex_data = self.get_hex_data(col, row)
         hex_data.improvement = improvement
-        
+        self.improvement_grid[col % self.GRID_COLS, row % self.GRID_ROWS] = _IMPROVEMENT_ID[improvement]
+        self.current_player.points += self.POINTS_PER_IMPROVEMENT.get(improvement, 0)
+        if improvement is _SETTLEMENT:
+            self.current_player.settlements.add((col, row))
+
         self.log_action(
-            f"Built {improvement.value} at ({col}, {row})",
+            lambda: f"Built {_IMP_NAME[improvement]} at ({col}, {row})",
             GameAction.BUILD_IMPROVEMENT,
-            {"col": col, "row": row, "improvement": improvement.value, "success": True}
+            {"col": col, "row": row, "improvement": _IMP_NAME[improvement], "success": True}
         )
+        if self.current_player.points >= self.POINTS_TO_WIN:
+            self._declare_winner(self.current_player)
         return True
+
+    def _declare_winner(self, winner: Optional[Player]):
+        """End the game, recording the winner (or a tie when None)"""
+        self.game_over = True
+        self.winner = winner
+        if winner:
+            self.log_action(
+                lambda: f"Game Over! {_PLAYER_TAG[winner.id]} wins with {winner.points} points!",
+                GameAction.END_TURN,
+                {"winner": winner.id, "points": winner.points}
+            )
+        else:
+            self.log_action(
+                lambda: "Game Over! It's a tie!",
+                GameAction.END_TURN,
+                {"winner": None}
+            )
     
     def calculate_player_points(self, player: Player) -> int:
-        """Calculate points for a player based on territory and improvements"""
-        points = len(player.owned_hexes) * self.POINTS_PER_HEX
-        
-        # Add points for improvements
-        for col, row in player.owned_hexes:
-            hex_data = self.get_hex_data(col, row)
-            if hex_data.improvement:
-                points += self.POINTS_PER_IMPROVEMENT.get(hex_data.improvement, 0)
-                
-        return points
-    
+        """Get points for a player; maintained incrementally on claim/build"""
+        return player.points
+
     def check_victory_conditions(self) -> Optional[Player]:
         """Check if any player has won or if the game should end"""
         # Check points victory
         for player in self.players:
-            points = self.calculate_player_points(player)
-            if points >= self.POINTS_TO_WIN:
+            if player.points >= self.POINTS_TO_WIN:
                 return player
-                
+
         # Check turn limit
         if self.turn_number >= self.MAX_TURNS:
             # Find player with most points
             max_points = -1
             winner = None
             for player in self.players:
-                points = self.calculate_player_points(player)
-                if points > max_points:
-                    max_points = points
+                if player.points > max_points:
+                    max_points = player.points
                     winner = player
-                elif points == max_points:
+                elif player.points == max_points:
                     winner = None  # Tie game
             return winner
-            
+
         return None
         
+    def step(self, action: GameAction, col: int = 0, row: int = 0,
+             improvement: Optional[ImprovementType] = None) -> bool:
+        """Apply one action for the current player; entry point for agents
+        driving the game without the pygame loop"""
+        if action is GameAction.CLAIM_HEX:
+            return self.claim_hex(col, row)
+        if action is GameAction.BUILD_IMPROVEMENT:
+            return self.build_improvement(col, row, improvement)
+        if action is GameAction.END_TURN:
+            self.end_turn()
+            return True
+        return False
+
     def end_turn(self):
         """End current player's turn and process turn effects"""
         if self.game_over:
             return
             
-        resources_gained = {}
-        
-        # Generate resources from improvements
-        for col, row in self.current_player.owned_hexes:
-            hex_data = self.get_hex_data(col, row)
-            if hex_data.improvement in self.RESOURCE_GENERATION:
-                gains = self.RESOURCE_GENERATION[hex_data.improvement]
-                self.current_player.add_resources(gains)
-                for res_type, amount in gains.items():
-                    resources_gained[res_type.value] = resources_gained.get(res_type.value, 0) + amount
-        
+        player = self.current_player
+
+        # Generate resources from improvements: gather improvement ids for
+        # every owned hex in one vectorized pass and sum gain-table rows
+        keys = player.owned_keys()
+        cols = (keys >> 16).astype(np.intp)
+        rows = (keys & 0xFFFF).astype(np.intp)
+        imps = self.improvement_grid[cols, rows]
+        gained = self.RESOURCE_GAIN_TABLE[imps[imps >= 0]].sum(axis=0, dtype=np.int32)
+        player.add_resources(gained)
+
+        resources_gained = {
+            res.label: int(amount) for res, amount in zip(ResourceType, gained) if amount
+        }
         self.log_action(
-            f"Ended turn, gained resources: {', '.join(f'{amount} {res}' for res, amount in resources_gained.items())}",
+            lambda: f"Ended turn, gained resources: {', '.join(f'{amount} {res}' for res, amount in resources_gained.items())}",
             GameAction.END_TURN,
             {"resources_gained": resources_gained}
         )
@@ -337,22 +425,27 @@ class GameState:
         self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
         if self.current_player_idx == 0:
             self.turn_number += 1
-            
-            # Check victory conditions at the end of each round
-            winner = self.check_victory_conditions()
-            if winner:
-                self.game_over = True
-                self.winner = winner
-                self.log_action(
-                    f"Game Over! Player {winner.id + 1} wins with {self.calculate_player_points(winner)} points!",
-                    GameAction.END_TURN,
-                    {"winner": winner.id, "points": self.calculate_player_points(winner)}
-                )
-            elif self.turn_number >= self.MAX_TURNS:
-                self.game_over = True
-                if not self.winner:
-                    self.log_action(
-                        "Game Over! It's a tie!",
-                        GameAction.END_TURN,
-                        {"winner": None}
-                    ) 
\ No newline at end of file
+
+            # Points victories are declared at the claim/build that crossed
+            # the threshold; only the turn limit is checked per round
+            if self.turn_number >= self.MAX_TURNS:
+                points = [player.points for player in self.players]
+                best = max(points)
+                if points.count(best) == 1:
+                    self._declare_winner(self.players[points.index(best)])
+                else:
+                    self._declare_winner(None)  # Tie game
+
+# Dense cost/generation vectors indexed by ResourceType, built once at import
+GameState.IMPROVEMENT_COST_VEC = {
+    improvement: _resource_vec(costs)
+    for improvement, costs in GameState.IMPROVEMENT_COSTS.items()
+}
+# Gain vectors stacked into a table indexed by improvement id; rows for
+# non-generating improvements stay zero
+GameState.RESOURCE_GAIN_TABLE = np.zeros(
+    (len(ImprovementType), len(ResourceType)), dtype=np.int32
+)
+for _improvement, _gains in GameState.RESOURCE_GENERATION.items():
+    GameState.RESOURCE_GAIN_TABLE[_IMPROVEMENT_ID[_improvement]] = _resource_vec(_gains)
+del _improvement, _gains
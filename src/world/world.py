@@ -1,25 +1,76 @@
 import numpy as np
-from noise import snoise2
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from typing import Tuple, List
+import hashlib
 import math
+import os
+from pathlib import Path
 
-class TerrainType(Enum):
-    WATER = (0, 0, 255)      # Blue
-    PLAINS = (34, 139, 34)   # Forest Green
-    FOREST = (0, 100, 0)     # Dark Green
-    MOUNTAIN = (139, 137, 137)  # Gray
-    TUNDRA = (238, 233, 233)  # Snow White
+from world._kernels import perlin_octaves
+
+# SIMD noise library, preferred for the default backend when its wheel is
+# available on this platform; the numba kernel covers everything else
+try:
+    import pyfastnoisesimd as fns
+except ImportError:
+    fns = None
+
+class TerrainType(IntEnum):
+    """Terrain bands in ascending noise order; values index PALETTE"""
+    WATER = 0
+    PLAINS = 1
+    FOREST = 2
+    MOUNTAIN = 3
+    TUNDRA = 4
+
+# Terrain colors as a (5, 3) uint8 table indexed by TerrainType, so
+# color lookups are array indexing instead of enum attribute access
+PALETTE = np.array([
+    (0, 0, 255),      # WATER - Blue
+    (34, 139, 34),    # PLAINS - Forest Green
+    (0, 100, 0),      # FOREST - Dark Green
+    (139, 137, 137),  # MOUNTAIN - Gray
+    (238, 233, 233),  # TUNDRA - Snow White
+], dtype=np.uint8)
+
+@lru_cache(maxsize=None)
+def _perm_table(seed: int) -> np.ndarray:
+    """Doubled permutation table for the Perlin lattice, one per seed"""
+    base = np.random.default_rng(seed).permutation(256).astype(np.int32)
+    return np.concatenate([base, base])
+
+# Noise thresholds splitting the 0-1 range into the five terrain bands
+_TERRAIN_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8])
+_TERRAIN_BY_CODE = tuple(TerrainType)
+
+# Unit-circle samples at the six flat-top corner angles, computed once
+_COS_TABLE = tuple(math.cos(math.pi / 3 * i) for i in range(6))
+_SIN_TABLE = tuple(math.sin(math.pi / 3 * i) for i in range(6))
+_SQRT3_OVER_3 = math.sqrt(3) / 3.0
+
+# On-disk cache of generated terrain grids; generation is deterministic
+# in its parameters, so a warm cache turns world creation into one load
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache'))) / 'younger-dryas'
 
 class World:
-    def __init__(self, width: int = 80, height: int = 60):
+    def __init__(self, width: int = 80, height: int = 60, method: str = 'perlin',
+                 seed: int = 0):
         self.width = width
         self.height = height
         self.scale = 50.0  # Scale factor for noise
         self.octaves = 6   # Number of passes for noise generation
         self.persistence = 0.5  # How much each octave contributes
         self.lacunarity = 2.0   # How much detail is added in each octave
+        self.method = method  # Terrain synthesis backend: 'perlin' or 'spectral'
+        self.seed = seed  # Drives every backend; same seed, same world
+        self._beta = 1.8  # Spectral falloff exponent for 1/f^beta synthesis
         self.terrain = self._generate_terrain()
+        # Terrain band per cell as small ints; color lookups index the
+        # palette instead of re-thresholding the float noise
+        self.terrain_code = self.get_terrain_codes(self.terrain)
+        # Per-cell RGB image resolved once at generation time
+        self.color_grid = PALETTE[self.terrain_code]
         
         # Hex grid constants
         self.hex_size = 40  # Distance from center to corner
@@ -28,47 +79,57 @@ class World:
         # Calculate horizontal and vertical spacing between hexes
         self.hex_horiz_spacing = self.hex_width * 3/4  # Overlapping portion gives tight fit
         self.hex_vert_spacing = self.hex_height
+        # Premultiplied edge constants for the branch-light containment
+        # test: sqrt(3)/2 * size and its product with size
+        self._x_thr = self.hex_size * 0.8660254
+        self._xy_limit = self.hex_size * self._x_thr
+        # Reciprocal so pixel_to_hex multiplies instead of dividing
+        self._inv_size = 1.0 / self.hex_size
         self.hex_vert = self._calculate_hex_vertices()
-        
+        self.hex_vert_np = np.array(self.hex_vert, dtype=np.float32)
+        self.hex_centers = self._calculate_hex_centers()
+
+    def _calculate_hex_centers(self) -> np.ndarray:
+        """Precompute the pixel center of every in-bounds hex as a (height, width, 2) array"""
+        cols = np.arange(self.width)
+        rows = np.arange(self.height)
+        centers = np.empty((self.height, self.width, 2), dtype=np.float64)
+        centers[:, :, 0] = cols * self.hex_horiz_spacing
+        centers[:, :, 1] = (rows[:, None] - (cols[None, :] & 1) * 0.5) * self.hex_vert_spacing
+        return centers
+
+    def hex_center(self, col: int, row: int) -> Tuple[float, float]:
+        """Look up the precomputed center of a hex, wrapping to world bounds"""
+        x, y = self.hex_centers[row % self.height, col % self.width]
+        return float(x), float(y)
+
     def _calculate_hex_vertices(self) -> List[Tuple[float, float]]:
         """Calculate the vertices of a hexagon relative to its center"""
-        vertices = []
-        for i in range(6):
-            angle_deg = 60 * i  # Start at 0 degrees (pointy top)
-            angle_rad = math.pi / 180 * angle_deg
-            x = self.hex_size * math.cos(angle_rad)
-            y = self.hex_size * math.sin(angle_rad)
-            vertices.append((x, y))
-        return vertices
+        return [
+            (self.hex_size * c, self.hex_size * s)
+            for c, s in zip(_COS_TABLE, _SIN_TABLE)
+        ]
         
     def point_in_hex(self, px: float, py: float, hex_x: float, hex_y: float) -> bool:
         """Test if a point is inside a hexagon centered at (hex_x, hex_y)"""
-        # Translate point to hex-relative coordinates
-        dx = px - hex_x
-        dy = py - hex_y
-        
-        # For flat-topped hexagons, we need to check against the hex bounds
-        # These are the magic numbers for a flat-topped hex
-        x_threshold = self.hex_size * 0.866025404  # sqrt(3)/2
-        y_threshold = self.hex_size * 0.5
-        
-        # Quick boundary check
-        if abs(dx) > self.hex_size or abs(dy) > self.hex_height/2:
-            return False
-            
-        # Detailed check using the hex shape
-        if abs(dx) <= x_threshold:
-            return abs(dy) <= self.hex_size
-        else:
-            slope = (self.hex_size - abs(dy)) / x_threshold
-            return slope * (self.hex_size - abs(dx)) >= 0
+        # Two premultiplied inequalities cover the flat-topped hex: the
+        # horizontal edges cap |dy|, the slanted edges cap the weighted sum
+        adx = abs(px - hex_x)
+        ady = abs(py - hex_y)
+        return ady <= self._x_thr and adx * self._x_thr + ady * 0.5 * self.hex_size <= self._xy_limit
+
+    def point_in_hex_np(self, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+        """Vectorized containment test for arrays of hex-relative offsets"""
+        adx = np.abs(dx)
+        ady = np.abs(dy)
+        return (ady <= self._x_thr) & (adx * self._x_thr + ady * (0.5 * self.hex_size) <= self._xy_limit)
 
     def pixel_to_hex(self, px: float, py: float) -> Tuple[int, int]:
         """Convert pixel coordinates to hex grid coordinates"""
         # Convert to hex coordinate space (using flat-topped hexagon formulas)
         # First convert to axial coordinates
-        q = (2.0/3.0 * px) / self.hex_size
-        r = (-1.0/3.0 * px + math.sqrt(3)/3.0 * py) / self.hex_size
+        q = (2.0 / 3.0 * px) * self._inv_size
+        r = (_SQRT3_OVER_3 * py - px / 3.0) * self._inv_size
         
         # Convert to cube coordinates for better rounding
         x = q
@@ -92,84 +153,207 @@ class World:
         else:
             rz = -rx - ry
             
-        # Convert back to offset coordinates
+        # Convert back to offset coordinates. The axial conversion above
+        # is the exact inverse of hex_to_pixel, so cube rounding always
+        # lands in the containing hex and no neighbor search is needed.
         col = rx
         row = rz + (rx + (rx & 1)) // 2
-        
-        # Verify the selected hex using point-in-hex test
-        center_x, center_y = self.hex_to_pixel(col, row)
-        if not self.point_in_hex(px, py, center_x, center_y):
-            # Check immediate neighbors if point isn't in the primary hex
-            best_distance = float('inf')
-            best_hex = (col, row)
-            
-            # Define neighbor offsets for flat-topped hexes
-            neighbors = [
-                (1, 0), (1, -1), (0, -1),
-                (-1, -1), (-1, 0), (0, 1)
-            ]
-            
-            for dc, dr in neighbors:
-                test_col = col + dc
-                test_row = row + dr
-                if test_col & 1:  # Adjust row for odd columns
-                    test_row += (dr == 0)  # Only adjust when moving horizontally
-                test_x, test_y = self.hex_to_pixel(test_col, test_row)
-                
-                if self.point_in_hex(px, py, test_x, test_y):
-                    dx = px - test_x
-                    dy = py - test_y
-                    dist = dx * dx + dy * dy
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_hex = (test_col, test_row)
-            
-            return best_hex
-            
         return col, row
         
+    def pixel_to_hex_batch(self, px: np.ndarray, py: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of pixel coordinates to hex grid coordinates
+
+        Same axial conversion and cube rounding as pixel_to_hex, applied
+        to whole arrays for bulk picks (highlighting, fog of war, AoE).
+        """
+        q = (2.0 / 3.0 * px) * self._inv_size
+        r = (_SQRT3_OVER_3 * py - px / 3.0) * self._inv_size
+
+        x = q
+        z = r
+        y = -x - z
+
+        rx = np.round(x)
+        ry = np.round(y)
+        rz = np.round(z)
+
+        x_diff = np.abs(rx - x)
+        y_diff = np.abs(ry - y)
+        z_diff = np.abs(rz - z)
+
+        # Reset the component with the largest rounding error; the masks
+        # are disjoint so each cell is fixed exactly once
+        fix_x = (x_diff > y_diff) & (x_diff > z_diff)
+        fix_y = ~fix_x & (y_diff > z_diff)
+        fix_z = ~fix_x & ~fix_y
+        rx = np.where(fix_x, -ry - rz, rx)
+        ry = np.where(fix_y, -rx - rz, ry)
+        rz = np.where(fix_z, -rx - ry, rz)
+
+        col = rx.astype(np.int64)
+        row = rz.astype(np.int64) + (col + (col & 1)) // 2
+        return col, row
+
     def hex_to_pixel(self, col: int, row: int) -> Tuple[float, float]:
         """Convert hex grid coordinates to pixel coordinates"""
-        # Using flat-topped hexagon coordinate system
+        # In-bounds hexes index the precomputed center table; coordinates
+        # outside the world (edge picks, scroll margins) fall back to the
+        # flat-topped arithmetic
+        if 0 <= col < self.width and 0 <= row < self.height:
+            x, y = self.hex_centers[row, col]
+            return float(x), float(y)
         x = col * self.hex_horiz_spacing
         y = (row - (col & 1) * 0.5) * self.hex_vert_spacing  # Adjust offset for odd columns
         return x, y
 
     def _generate_terrain(self) -> np.ndarray:
-        """Generate terrain using Perlin noise"""
-        world = np.zeros((self.height, self.width))
-        
-        # Generate base noise
-        for y in range(self.height):
-            for x in range(self.width):
-                world[y][x] = snoise2(
-                    x / self.scale, 
-                    y / self.scale, 
-                    octaves=self.octaves, 
-                    persistence=self.persistence,
-                    lacunarity=self.lacunarity
-                )
-        
-        # Normalize values to 0-1 range
-        world = (world - world.min()) / (world.max() - world.min())
+        """Generate terrain with the selected backend, normalized to 0-1
+
+        Finished grids are cached on disk keyed by a hash of the
+        generation parameters, so rebuilding the same world is a memory-
+        mapped load instead of a recompute.
+        """
+        backend = 'fns' if self.method == 'perlin' and fns is not None else self.method
+        params = (self.width, self.height, self.scale, self.octaves,
+                  self.persistence, self.lacunarity, self.seed, backend)
+        key = hashlib.blake2b(repr(params).encode()).hexdigest()[:16]
+        cache_path = _CACHE_DIR / f"terrain_{key}.npy"
+        if cache_path.exists():
+            return np.load(cache_path, mmap_mode='r')
+
+        if self.method == 'spectral':
+            world = self._generate_terrain_spectral()
+        elif self.method == 'dsq':
+            world = self._generate_terrain_dsq()
+        elif fns is not None:
+            world = self._generate_terrain_fns()
+        else:
+            world = perlin_octaves(
+                self.width, self.height, self.scale,
+                self.octaves, self.persistence, self.lacunarity,
+                _perm_table(self.seed)
+            )
+
+        # Normalize to 0-1 in place; out= keeps the two passes from
+        # materializing full-size temporaries
+        mn = world.min()
+        scale = 1.0 / (world.max() - mn)
+        np.subtract(world, mn, out=world)
+        np.multiply(world, scale, out=world)
+
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, world)
         return world
+
+    def _generate_terrain_spectral(self) -> np.ndarray:
+        """Fractal terrain via 1/f^beta spectral synthesis
+
+        Shapes white noise in the frequency domain and inverse-transforms
+        it: one FFT pair instead of per-octave lattice evaluation, so cost
+        stays O(WH log WH) however fine the detail.
+        """
+        rng = np.random.default_rng(self.seed)
+        spectrum = np.fft.rfft2(rng.standard_normal((self.height, self.width)))
+        ky = np.fft.fftfreq(self.height)[:, None]
+        kx = np.fft.rfftfreq(self.width)[None, :]
+        radius = np.hypot(ky, kx)
+        radius[0, 0] = 1.0  # Keep the DC term finite
+        spectrum /= radius ** self._beta
+        world = np.fft.irfft2(spectrum, s=(self.height, self.width))
+        return world.astype(np.float32)
+
+    def _generate_terrain_dsq(self) -> np.ndarray:
+        """Fractal terrain via diamond-square midpoint displacement
+
+        Runs on a (2^n + 1) square grid and crops to world size. Each pass
+        is pure strided adds plus a random displacement — no trig and no
+        lattice hashing — so total work is O(N) in grid cells.
+        """
+        rng = np.random.default_rng(self.seed)
+        n = max(self.width - 1, self.height - 1, 1)
+        size = 1 << (n - 1).bit_length()  # Next power of two
+        grid = np.zeros((size + 1, size + 1), dtype=np.float32)
+        grid[::size, ::size] = rng.standard_normal((2, 2))
+
+        step = size
+        roughness = 1.0
+        while step > 1:
+            half = step // 2
+            # Diamond pass: each cell center gets the mean of its four
+            # diagonal corners plus a displacement
+            corners = (grid[:-step:step, :-step:step]
+                       + grid[:-step:step, step::step]
+                       + grid[step::step, :-step:step]
+                       + grid[step::step, step::step])
+            centers = grid[half::step, half::step]
+            centers[...] = 0.25 * corners + roughness * rng.standard_normal(centers.shape)
+
+            # Square pass: edge midpoints get the mean of their in-bounds
+            # axial neighbors plus a displacement
+            for row_off, col_off in ((0, half), (half, 0)):
+                rows = np.arange(row_off, size + 1, step)
+                cols = np.arange(col_off, size + 1, step)
+                rr, cc = np.meshgrid(rows, cols, indexing='ij')
+                total = np.zeros(rr.shape, dtype=np.float32)
+                count = np.zeros(rr.shape, dtype=np.float32)
+                for dr, dc in ((-half, 0), (half, 0), (0, -half), (0, half)):
+                    nr = rr + dr
+                    nc = cc + dc
+                    valid = (nr >= 0) & (nr <= size) & (nc >= 0) & (nc <= size)
+                    total += np.where(valid, grid[nr % (size + 1), nc % (size + 1)], 0.0)
+                    count += valid
+                grid[rr, cc] = total / count + roughness * rng.standard_normal(rr.shape).astype(np.float32)
+
+            roughness *= 0.5
+            step = half
+
+        return grid[:self.height, :self.width].copy()
+
+    def _generate_terrain_fns(self) -> np.ndarray:
+        """Fractal terrain via pyfastnoisesimd's SIMD simplex backend
+
+        Same octave parameters as the numba kernel, evaluated with AVX
+        instructions across all worker threads in a single grid call.
+        """
+        noise = fns.Noise(seed=self.seed, numWorkers=os.cpu_count())
+        noise.frequency = 1.0 / self.scale
+        noise.noiseType = fns.NoiseType.SimplexFractal
+        noise.fractal.octaves = self.octaves
+        noise.fractal.lacunarity = self.lacunarity
+        noise.fractal.gain = self.persistence
+        return noise.genAsGrid(shape=[self.height, self.width]).astype(np.float32)
     
     def get_terrain_type(self, value: float) -> TerrainType:
         """Convert noise value to terrain type"""
-        if value < 0.2:
-            return TerrainType.WATER
-        elif value < 0.4:
-            return TerrainType.PLAINS
-        elif value < 0.6:
-            return TerrainType.FOREST
-        elif value < 0.8:
-            return TerrainType.MOUNTAIN
-        else:
-            return TerrainType.TUNDRA
+        # Binary search over the shared thresholds replaces the if/elif
+        # chain; same bands as terrain_code
+        return _TERRAIN_BY_CODE[int(np.searchsorted(_TERRAIN_THRESHOLDS, value, side='right'))]
+
+    def get_terrain_codes(self, values: np.ndarray) -> np.ndarray:
+        """Band codes for a whole array of noise values
+
+        Same encoding as terrain_code: index into _TERRAIN_BY_CODE or
+        PALETTE to resolve types or colors in bulk.
+        """
+        return np.digitize(values, _TERRAIN_THRESHOLDS).astype(np.uint8)
     
     def get_color_at(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get the color for a specific coordinate"""
         if 0 <= y < self.height and 0 <= x < self.width:
-            value = self.terrain[y][x]
-            return self.get_terrain_type(value).value
-        return (0, 0, 0)  # Black for out of bounds 
\ No newline at end of file
+            r, g, b = self.color_grid[y, x]
+            return int(r), int(g), int(b)
+        return (0, 0, 0)  # Black for out of bounds
+
+    def get_color_block(self, y0: int, y1: int, x0: int, x1: int) -> np.ndarray:
+        """A (rows, cols, 3) uint8 view of the color image for bulk blits"""
+        return self.color_grid[y0:y1, x0:x1]
+
+    def blit_to(self, surface) -> None:
+        """Copy the whole color image onto a (width, height) surface
+
+        One surfarray transfer instead of width*height get_color_at
+        calls; pygame surfaces are column-major, hence the transpose.
+        Useful for minimap-style views of the full grid.
+        """
+        import pygame.surfarray
+        pygame.surfarray.blit_array(surface, np.transpose(self.color_grid, (1, 0, 2)))
\ No newline at end of file